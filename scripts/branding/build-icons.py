@@ -1,18 +1,29 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
 import shutil
+import struct
 import subprocess
 import sys
 import tempfile
+from typing import TYPE_CHECKING
 
-try:
+if TYPE_CHECKING:
+  import numpy as np
   from PIL import Image, ImageOps
-except ImportError as exc:
-  raise SystemExit(
-    '[branding] Pillow is required. Install it with: python3 -m pip install Pillow'
-  ) from exc
+else:
+  # Bound by load_imaging_modules(), which must run before any imaging helper is used.
+  Image = None
+  ImageOps = None
+  np = None
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 
@@ -23,8 +34,28 @@ DESKTOP_ICON_PNG_PATH = ROOT_DIR / 'public' / 'branding' / 'app-icon-desktop.png
 DESKTOP_ICON_ICO_PATH = ROOT_DIR / 'public' / 'branding' / 'icon.ico'
 DESKTOP_ICON_ICNS_PATH = ROOT_DIR / 'public' / 'branding' / 'icon.icns'
 ICONSET_SOURCE_ICON_NAME = 'AppIcon'
-ICONSET_SOURCE_PNG_NAME = 'icon_512x512@2x.png'
+ICONSET_LARGEST_PNG_NAME = 'icon_512x512@2x.png'
 ICON_CANVAS_SIZE = 1024
+MASK_CACHE_DIR = ROOT_DIR / 'branding' / '.cache'
+MACOS_CANDIDATE_CACHE_PATH = MASK_CACHE_DIR / 'macos-candidates.json'
+BUILD_STAMP_PATH = MASK_CACHE_DIR / 'build-stamp'
+BUILD_OUTPUT_PATHS = [
+  RENDERER_ICON_PATH,
+  DESKTOP_SOURCE_COPY_PATH,
+  DESKTOP_ICON_PNG_PATH,
+  DESKTOP_ICON_ICO_PATH,
+  DESKTOP_ICON_ICNS_PATH,
+]
+ICONSET_PNG_NAME_PATTERN = re.compile(r'^icon_(\d+)x(\d+)(@2x)?\.png$')
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+ICO_ICON_SIZES = [16, 24, 32, 48, 64, 128, 256]
+# Superellipse-cornered rounded rect calibrated against the macOS standard mask on the 1024px
+# canvas (re-run with --from-system to compare). Its 50% alpha edge stays within one pixel of
+# the system shape, but the low-alpha fringe of the system mask (mostly below the icon) is not
+# reproduced.
+SQUIRCLE_MASK_BOX = (126, 115, 898, 887)
+SQUIRCLE_MASK_RADIUS = 204
+SQUIRCLE_MASK_EXPONENT = 2.45
 
 # Native apps that use the standard macOS container metrics.
 MACOS_ICON_CAR_CANDIDATES = [
@@ -45,7 +76,33 @@ MACOS_ICON_ICNS_CANDIDATES = [
 ]
 
 
+def load_imaging_modules() -> None:
+  # Pillow and NumPy are only imported once a build is actually needed, so no-op runs stay fast.
+  global Image, ImageOps, np
+
+  if Image is not None:
+    return
+
+  try:
+    from PIL import Image, ImageOps
+  except ImportError as exc:
+    raise SystemExit(
+      '[branding] Pillow is required. Install it with: python3 -m pip install Pillow'
+    ) from exc
+
+  try:
+    import numpy as np
+  except ImportError:
+    # NumPy is optional; without it the Pillow-only code paths are used.
+    np = None
+
+
 def build_desktop_icon_with_mask(source: Image.Image, mask: Image.Image) -> Image.Image:
+  # Box-reduce large masters by an integer factor first so LANCZOS only handles the final step.
+  reduce_factor = min(source.size) // ICON_CANVAS_SIZE
+  if reduce_factor >= 2:
+    source = source.reduce(reduce_factor)
+
   icon_content = ImageOps.fit(
     source.convert('RGBA'),
     (ICON_CANVAS_SIZE, ICON_CANVAS_SIZE),
@@ -57,12 +114,81 @@ def build_desktop_icon_with_mask(source: Image.Image, mask: Image.Image) -> Imag
   return rounded_content
 
 
+def load_alpha_channel(image_path: Path) -> Image.Image:
+  # Take alpha straight from images that already carry it; only convert the ones that do not.
+  with Image.open(image_path) as image:
+    if 'A' in image.getbands():
+      return image.getchannel('A')
+    return image.convert('RGBA').getchannel('A')
+
+
+def generate_squircle_mask(
+  size: int = ICON_CANVAS_SIZE,
+  box: tuple[int, int, int, int] = SQUIRCLE_MASK_BOX,
+  radius: int = SQUIRCLE_MASK_RADIUS,
+  exponent: float = SQUIRCLE_MASK_EXPONENT,
+) -> Image.Image:
+  # Rasterize the top-left corner as |x|^n + |y|^n <= 1 with a one-pixel anti-aliased edge;
+  # the other three corners are mirror images and everything else inside the box is opaque.
+  if np is not None:
+    offsets = (radius - np.arange(radius) - 0.5) / radius
+    level = offsets[np.newaxis, :] ** exponent + offsets[:, np.newaxis] ** exponent
+    coverage = np.clip(0.5 - (level ** (1 / exponent) - 1) * radius, 0, 1)
+    corner = Image.fromarray(np.round(coverage * 255).astype(np.uint8))
+  else:
+    offsets = [(radius - index - 0.5) / radius for index in range(radius)]
+    corner_values = bytearray()
+    for offset_y in offsets:
+      for offset_x in offsets:
+        level = offset_x ** exponent + offset_y ** exponent
+        coverage = min(max(0.5 - (level ** (1 / exponent) - 1) * radius, 0), 1)
+        corner_values.append(round(coverage * 255))
+    corner = Image.frombytes('L', (radius, radius), bytes(corner_values))
+
+  x0, y0, x1, y1 = box
+  mask = Image.new('L', (size, size), 0)
+  mask.paste(255, box)
+  mask.paste(corner, (x0, y0))
+  mask.paste(corner.transpose(Image.Transpose.FLIP_LEFT_RIGHT), (x1 - radius, y0))
+  mask.paste(corner.transpose(Image.Transpose.FLIP_TOP_BOTTOM), (x0, y1 - radius))
+  mask.paste(corner.transpose(Image.Transpose.ROTATE_180), (x1 - radius, y1 - radius))
+  return mask
+
+
+def build_icon_mipmaps(icon: Image.Image, sizes: list[int]) -> dict[int, Image.Image]:
+  # Resample each level from the previous (next larger) one instead of from the full master.
+  mipmaps: dict[int, Image.Image] = {}
+  current_level = icon
+  for size in sorted(sizes, reverse=True):
+    if current_level.size != (size, size):
+      current_level = current_level.resize((size, size), Image.Resampling.LANCZOS)
+    mipmaps[size] = current_level
+  return mipmaps
+
+
+def run_iconutil(command: list[str]) -> None:
+  # stdout is never used; only stderr is kept, and only decoded when iconutil fails.
+  completed = subprocess.run(
+    command,
+    check=False,
+    stdout=subprocess.DEVNULL,
+    stderr=subprocess.PIPE,
+  )
+  if completed.returncode != 0:
+    raise subprocess.CalledProcessError(
+      completed.returncode,
+      command,
+      stderr=completed.stderr.decode('utf-8', 'replace'),
+    )
+
+
 def extract_iconset_from_assets_car(
   iconutil_path: str,
   car_path: Path,
-) -> tuple[tempfile.TemporaryDirectory[str], Path]:
-  temp_dir = tempfile.TemporaryDirectory(prefix='branding-icon-mask-car-')
-  iconset_dir = Path(temp_dir.name) / 'AppIcon.iconset'
+  output_dir: Path,
+) -> Path:
+  output_dir.mkdir(parents=True, exist_ok=True)
+  iconset_dir = output_dir / 'AppIcon.iconset'
   extraction_command = [
     iconutil_path,
     '-c',
@@ -72,48 +198,79 @@ def extract_iconset_from_assets_car(
     '-o',
     str(iconset_dir),
   ]
-  subprocess.run(
-    extraction_command,
-    check=True,
-    capture_output=True,
-    text=True,
+  run_iconutil(extraction_command)
+  return iconset_dir
+
+
+def load_preferred_macos_candidates() -> dict[str, Path]:
+  try:
+    cached_candidates = json.loads(MACOS_CANDIDATE_CACHE_PATH.read_text(encoding='utf-8'))
+  except (OSError, ValueError):
+    return {}
+
+  if not isinstance(cached_candidates, dict):
+    return {}
+  return {
+    kind: Path(candidate_path)
+    for kind, candidate_path in cached_candidates.items()
+    if isinstance(candidate_path, str)
+  }
+
+
+def save_preferred_macos_candidates(car_path: Path, icns_path: Path) -> None:
+  MASK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+  MACOS_CANDIDATE_CACHE_PATH.write_text(
+    json.dumps({'car': str(car_path), 'icns': str(icns_path)}, indent=2),
+    encoding='utf-8',
   )
-  return temp_dir, iconset_dir
 
 
-def load_macos_container_bbox(iconutil_path: str) -> tuple[tuple[int, int, int, int], Path]:
+def prioritize_candidates(candidates: list[Path], preferred_path: Path | None) -> list[Path]:
+  # Try the last successful candidate first; the rest keep their order as fallbacks.
+  if preferred_path is None or preferred_path not in candidates:
+    return candidates
+  return [preferred_path, *(candidate for candidate in candidates if candidate != preferred_path)]
+
+
+def load_macos_container_bbox(
+  iconutil_path: str,
+  work_dir: Path,
+  preferred_car_path: Path | None = None,
+) -> tuple[tuple[int, int, int, int], Path]:
   extraction_errors: list[str] = []
+  car_candidates = prioritize_candidates(MACOS_ICON_CAR_CANDIDATES, preferred_car_path)
 
-  for car_path in MACOS_ICON_CAR_CANDIDATES:
+  for candidate_index, car_path in enumerate(car_candidates):
     if not car_path.exists():
       extraction_errors.append(f'{car_path}: missing')
       continue
 
     try:
-      temp_dir, iconset_dir = extract_iconset_from_assets_car(iconutil_path, car_path)
+      iconset_dir = extract_iconset_from_assets_car(
+        iconutil_path,
+        car_path,
+        work_dir / f'car-{candidate_index}',
+      )
     except subprocess.CalledProcessError as exc:
-      reason = (exc.stderr or exc.stdout or '').strip() or 'iconutil failed'
+      reason = (exc.stderr or '').strip() or 'iconutil failed'
       extraction_errors.append(f'{car_path}: {reason}')
       continue
 
-    try:
-      mask_source_path = iconset_dir / ICONSET_SOURCE_PNG_NAME
-      if not mask_source_path.exists():
-        extraction_errors.append(f'{car_path}: missing {ICONSET_SOURCE_PNG_NAME}')
-        continue
+    mask_source_path = iconset_dir / ICONSET_LARGEST_PNG_NAME
+    if not mask_source_path.exists():
+      extraction_errors.append(f'{car_path}: missing {ICONSET_LARGEST_PNG_NAME}')
+      continue
 
-      mask = Image.open(mask_source_path).convert('RGBA').getchannel('A')
-      if mask.size != (ICON_CANVAS_SIZE, ICON_CANVAS_SIZE):
-        mask = mask.resize((ICON_CANVAS_SIZE, ICON_CANVAS_SIZE), Image.Resampling.LANCZOS)
+    mask = load_alpha_channel(mask_source_path)
+    if mask.size != (ICON_CANVAS_SIZE, ICON_CANVAS_SIZE):
+      mask = mask.resize((ICON_CANVAS_SIZE, ICON_CANVAS_SIZE), Image.Resampling.LANCZOS)
 
-      bbox = mask.getbbox()
-      if bbox is None:
-        extraction_errors.append(f'{car_path}: extracted alpha mask is empty')
-        continue
+    bbox = mask.getbbox()
+    if bbox is None:
+      extraction_errors.append(f'{car_path}: extracted alpha mask is empty')
+      continue
 
-      return bbox, car_path
-    finally:
-      temp_dir.cleanup()
+    return bbox, car_path
 
   formatted_errors = '\n'.join(f'  - {message}' for message in extraction_errors)
   raise RuntimeError(
@@ -125,9 +282,10 @@ def load_macos_container_bbox(iconutil_path: str) -> tuple[tuple[int, int, int,
 def extract_iconset_from_icns(
   iconutil_path: str,
   icns_path: Path,
-) -> tuple[tempfile.TemporaryDirectory[str], Path]:
-  temp_dir = tempfile.TemporaryDirectory(prefix='branding-icon-mask-icns-')
-  iconset_dir = Path(temp_dir.name) / 'AppIcon.iconset'
+  output_dir: Path,
+) -> Path:
+  output_dir.mkdir(parents=True, exist_ok=True)
+  iconset_dir = output_dir / 'AppIcon.iconset'
   extraction_command = [
     iconutil_path,
     '-c',
@@ -136,13 +294,25 @@ def extract_iconset_from_icns(
     '-o',
     str(iconset_dir),
   ]
-  subprocess.run(
-    extraction_command,
-    check=True,
-    capture_output=True,
-    text=True,
-  )
-  return temp_dir, iconset_dir
+  run_iconutil(extraction_command)
+  return iconset_dir
+
+
+def read_icon_png_size(png_path: Path) -> tuple[int, int] | None:
+  # Apple iconsets encode the pixel size in the file name, e.g. icon_512x512@2x.png.
+  name_match = ICONSET_PNG_NAME_PATTERN.match(png_path.name)
+  if name_match is not None:
+    scale = 2 if name_match.group(3) else 1
+    return int(name_match.group(1)) * scale, int(name_match.group(2)) * scale
+
+  # Otherwise read width/height straight from the IHDR chunk instead of decoding the image.
+  with png_path.open('rb') as png_file:
+    header = png_file.read(24)
+  if len(header) < 24 or header[:8] != PNG_SIGNATURE or header[12:16] != b'IHDR':
+    return None
+
+  width, height = struct.unpack('>II', header[16:24])
+  return width, height
 
 
 def select_largest_icon_png(iconset_dir: Path) -> Path | None:
@@ -150,11 +320,15 @@ def select_largest_icon_png(iconset_dir: Path) -> Path | None:
   largest_area = -1
   for candidate in iconset_dir.glob('*.png'):
     try:
-      with Image.open(candidate) as icon_image:
-        width, height = icon_image.size
+      icon_size = read_icon_png_size(candidate)
     except OSError:
       continue
 
+    if icon_size is None:
+      continue
+
+    width, height = icon_size
+
     area = width * height
     if area > largest_area:
       largest_area = area
@@ -163,36 +337,45 @@ def select_largest_icon_png(iconset_dir: Path) -> Path | None:
   return largest_path
 
 
-def load_macos_rounded_shape_mask(iconutil_path: str) -> tuple[Image.Image, Path]:
+def load_macos_rounded_shape_mask(
+  iconutil_path: str,
+  work_dir: Path,
+  preferred_icns_path: Path | None = None,
+) -> tuple[Image.Image, Path]:
   extraction_errors: list[str] = []
+  icns_candidates = prioritize_candidates(MACOS_ICON_ICNS_CANDIDATES, preferred_icns_path)
 
-  for icns_path in MACOS_ICON_ICNS_CANDIDATES:
+  for candidate_index, icns_path in enumerate(icns_candidates):
     if not icns_path.exists():
       extraction_errors.append(f'{icns_path}: missing')
       continue
 
     try:
-      temp_dir, iconset_dir = extract_iconset_from_icns(iconutil_path, icns_path)
+      iconset_dir = extract_iconset_from_icns(
+        iconutil_path,
+        icns_path,
+        work_dir / f'icns-{candidate_index}',
+      )
     except subprocess.CalledProcessError as exc:
-      reason = (exc.stderr or exc.stdout or '').strip() or 'iconutil failed'
+      reason = (exc.stderr or '').strip() or 'iconutil failed'
       extraction_errors.append(f'{icns_path}: {reason}')
       continue
 
-    try:
+    # Iconsets normally ship the 1024px image under a fixed name; only scan when it is absent.
+    largest_png: Path | None = iconset_dir / ICONSET_LARGEST_PNG_NAME
+    if not largest_png.exists():
       largest_png = select_largest_icon_png(iconset_dir)
-      if largest_png is None:
-        extraction_errors.append(f'{icns_path}: no PNG images in extracted iconset')
-        continue
+    if largest_png is None:
+      extraction_errors.append(f'{icns_path}: no PNG images in extracted iconset')
+      continue
 
-      alpha = Image.open(largest_png).convert('RGBA').getchannel('A')
-      bbox = alpha.getbbox()
-      if bbox is None:
-        extraction_errors.append(f'{icns_path}: extracted alpha mask is empty')
-        continue
+    alpha = load_alpha_channel(largest_png)
+    bbox = alpha.getbbox()
+    if bbox is None:
+      extraction_errors.append(f'{icns_path}: extracted alpha mask is empty')
+      continue
 
-      return alpha, icns_path
-    finally:
-      temp_dir.cleanup()
+    return alpha, icns_path
 
   formatted_errors = '\n'.join(f'  - {message}' for message in extraction_errors)
   raise RuntimeError(
@@ -206,14 +389,18 @@ def reshape_mask_to_bbox(source_alpha: Image.Image, target_bbox: tuple[int, int,
   if source_bbox is None:
     raise RuntimeError('[branding] source rounded alpha is empty')
 
-  source_cropped = source_alpha.crop(source_bbox)
   target_x0, target_y0, target_x1, target_y1 = target_bbox
   target_width = target_x1 - target_x0
   target_height = target_y1 - target_y0
   if target_width <= 0 or target_height <= 0:
     raise RuntimeError(f'[branding] invalid target bbox: {target_bbox}')
 
-  resized_shape = source_cropped.resize((target_width, target_height), Image.Resampling.LANCZOS)
+  # Let resize() crop via box= so the shape is resampled in a single pass.
+  resized_shape = source_alpha.resize(
+    (target_width, target_height),
+    Image.Resampling.LANCZOS,
+    box=source_bbox,
+  )
   output_mask = Image.new('L', (ICON_CANVAS_SIZE, ICON_CANVAS_SIZE), 0)
   output_mask.paste(resized_shape, (target_x0, target_y0))
 
@@ -232,46 +419,255 @@ def load_macos_standard_mask() -> tuple[Image.Image, Path, Path]:
   if iconutil_path is None:
     raise RuntimeError('[branding] iconutil is missing, cannot extract macOS standard icon mask.')
 
-  container_bbox, container_source = load_macos_container_bbox(iconutil_path)
-  rounded_shape_alpha, rounded_shape_source = load_macos_rounded_shape_mask(iconutil_path)
+  preferred_candidates = load_preferred_macos_candidates()
+
+  # Both extractions are independent iconutil subprocesses, so run them concurrently.
+  # They share one temporary root (separate subdirectories per candidate) that is removed once.
+  with tempfile.TemporaryDirectory(prefix='branding-icon-') as temp_root:
+    work_dir = Path(temp_root)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+      container_future = executor.submit(
+        load_macos_container_bbox,
+        iconutil_path,
+        work_dir,
+        preferred_candidates.get('car'),
+      )
+      rounded_shape_future = executor.submit(
+        load_macos_rounded_shape_mask,
+        iconutil_path,
+        work_dir,
+        preferred_candidates.get('icns'),
+      )
+      container_bbox, container_source = container_future.result()
+      rounded_shape_alpha, rounded_shape_source = rounded_shape_future.result()
+
+  if (
+    preferred_candidates.get('car') != container_source
+    or preferred_candidates.get('icns') != rounded_shape_source
+  ):
+    save_preferred_macos_candidates(container_source, rounded_shape_source)
+
   mask = reshape_mask_to_bbox(rounded_shape_alpha, container_bbox)
   return mask, container_source, rounded_shape_source
 
 
-def build_icons_from_source(source_path: Path) -> tuple[Path, Path]:
+def write_bytes_atomically(destination_path: Path, data: bytes) -> None:
+  # Write a uniquely named sibling temp file and swap it in, so an interrupted or concurrent
+  # run never leaves a partial output or a stray temp file in the packaged branding folder.
+  temp_path: Path | None = None
+  try:
+    with tempfile.NamedTemporaryFile(
+      dir=destination_path.parent,
+      prefix=f'.{destination_path.name}.',
+      suffix='.tmp',
+      delete=False,
+    ) as temp_file:
+      temp_path = Path(temp_file.name)
+      temp_file.write(data)
+    # NamedTemporaryFile creates 0600 files; keep the usual permissions for generated assets.
+    temp_path.chmod(0o644)
+    os.replace(temp_path, destination_path)
+  finally:
+    if temp_path is not None:
+      temp_path.unlink(missing_ok=True)
+
+
+def save_image_atomically(image: Image.Image, destination_path: Path, **save_options: object) -> None:
+  # Encode fully in memory first so a failed encode never touches the destination.
+  encoded = io.BytesIO()
+  image.save(encoded, **save_options)
+  write_bytes_atomically(destination_path, encoded.getvalue())
+
+
+def save_desktop_icon_ico(icon: Image.Image) -> None:
+  # Hand the ICO encoder pre-sized frames so it does not resample the master once per size.
+  ico_mipmaps = build_icon_mipmaps(icon, ICO_ICON_SIZES)
+  largest_frame = ico_mipmaps[max(ICO_ICON_SIZES)]
+  save_image_atomically(
+    largest_frame,
+    DESKTOP_ICON_ICO_PATH,
+    format='ICO',
+    sizes=[(size, size) for size in ICO_ICON_SIZES],
+    append_images=[ico_mipmaps[size] for size in ICO_ICON_SIZES],
+  )
+
+
+def save_desktop_icon_icns(icon: Image.Image) -> None:
+  # The PNG output is saved from the same master concurrently, so encode ICNS from a copy.
+  save_image_atomically(icon.copy(), DESKTOP_ICON_ICNS_PATH, format='ICNS')
+
+
+def get_standard_mask_cache_key() -> str:
+  product_version = subprocess.check_output(['sw_vers', '-productVersion'], text=True).strip()
+  return f'{product_version}|{ICON_CANVAS_SIZE}'
+
+
+def load_cached_standard_mask(use_cache: bool = True) -> tuple[Image.Image, Path, Path]:
+  # The standard mask only depends on the host macOS version, so reuse it across runs.
+  if sys.platform != 'darwin':
+    return load_macos_standard_mask()
+
+  cache_key = get_standard_mask_cache_key()
+  cache_hash = hashlib.blake2b(cache_key.encode('utf-8'), digest_size=8).hexdigest()
+  mask_cache_path = MASK_CACHE_DIR / f'standard-mask-{cache_hash}.png'
+  sidecar_cache_path = mask_cache_path.with_suffix('.json')
+
+  if use_cache and mask_cache_path.exists() and sidecar_cache_path.exists():
+    try:
+      sidecar = json.loads(sidecar_cache_path.read_text(encoding='utf-8'))
+      if isinstance(sidecar, dict) and sidecar.get('key') == cache_key:
+        with Image.open(mask_cache_path) as cached_mask:
+          mask = cached_mask.convert('L')
+        if mask.size == (ICON_CANVAS_SIZE, ICON_CANVAS_SIZE):
+          return mask, Path(sidecar['container_source']), Path(sidecar['rounded_shape_source'])
+    except (OSError, ValueError, KeyError, TypeError):
+      pass
+
+  mask, container_source, rounded_shape_source = load_macos_standard_mask()
+  MASK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+  save_image_atomically(mask, mask_cache_path, format='PNG', optimize=True)
+  write_bytes_atomically(
+    sidecar_cache_path,
+    json.dumps(
+      {
+        'key': cache_key,
+        'container_source': str(container_source),
+        'rounded_shape_source': str(rounded_shape_source),
+      },
+      indent=2,
+    ).encode('utf-8'),
+  )
+  return mask, container_source, rounded_shape_source
+
+
+def build_icons_from_source(
+  source_path: Path,
+  from_system: bool = False,
+  use_cache: bool = True,
+) -> tuple[Path, Path] | None:
+  load_imaging_modules()
+
   RENDERER_ICON_PATH.parent.mkdir(parents=True, exist_ok=True)
   DESKTOP_ICON_PNG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-  # Keep renderer and source-copy PNG assets as exact source bytes.
-  shutil.copyfile(source_path, RENDERER_ICON_PATH)
-  shutil.copyfile(source_path, DESKTOP_SOURCE_COPY_PATH)
-
-  source = Image.open(source_path).convert('RGBA')
-  standard_mask, container_source, rounded_shape_source = load_macos_standard_mask()
+  # Read the source once: keep renderer and source-copy PNG assets as exact source bytes
+  # and decode the same in-memory bytes for the rounded desktop icon.
+  source_bytes = source_path.read_bytes()
+  RENDERER_ICON_PATH.write_bytes(source_bytes)
+  DESKTOP_SOURCE_COPY_PATH.write_bytes(source_bytes)
+
+  with Image.open(io.BytesIO(source_bytes)) as source_image:
+    # Lets JPEG masters decode at a reduced scale; a no-op for PNG sources.
+    source_image.draft('RGB', (ICON_CANVAS_SIZE, ICON_CANVAS_SIZE))
+    source = source_image.convert('RGBA')
+
+  system_sources: tuple[Path, Path] | None = None
+  if from_system:
+    standard_mask, container_source, rounded_shape_source = load_cached_standard_mask(use_cache)
+    system_sources = (container_source, rounded_shape_source)
+  else:
+    standard_mask = generate_squircle_mask()
   rounded_desktop_icon = build_desktop_icon_with_mask(source, standard_mask)
-  rounded_desktop_icon.save(DESKTOP_ICON_PNG_PATH, format='PNG')
 
-  rounded_desktop_icon.save(
-    DESKTOP_ICON_ICO_PATH,
-    format='ICO',
-    sizes=[(16, 16), (24, 24), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)],
+  # The three encoders write distinct files and Pillow releases the GIL while resampling and
+  # compressing, so run them concurrently. Each task saves its own image objects because
+  # Image.save() stores per-call state on the image it is invoked on.
+  with ThreadPoolExecutor(max_workers=3) as executor:
+    output_futures = [
+      executor.submit(
+        save_image_atomically,
+        rounded_desktop_icon,
+        DESKTOP_ICON_PNG_PATH,
+        format='PNG',
+        optimize=True,
+      ),
+      executor.submit(save_desktop_icon_ico, rounded_desktop_icon),
+      executor.submit(save_desktop_icon_icns, rounded_desktop_icon),
+    ]
+    for output_future in output_futures:
+      output_future.result()
+
+  return system_sources
+
+
+def get_build_stamp(from_system: bool) -> str | None:
+  if not from_system:
+    return f'squircle|{ICON_CANVAS_SIZE}'
+  if sys.platform != 'darwin':
+    return None
+  return f'system|{get_standard_mask_cache_key()}'
+
+
+def is_build_up_to_date(build_stamp: str | None) -> bool:
+  # Outputs must be newer than both the source icon and this script (which holds the mask
+  # parameters), and built with the same mask mode and macOS mask key a rebuild would use now.
+  if build_stamp is None:
+    return False
+
+  try:
+    input_mtime = max(SOURCE_ICON_PATH.stat().st_mtime, Path(__file__).stat().st_mtime)
+    if any(output_path.stat().st_mtime < input_mtime for output_path in BUILD_OUTPUT_PATHS):
+      return False
+    return BUILD_STAMP_PATH.read_text(encoding='utf-8').strip() == build_stamp
+  except OSError:
+    return False
+
+
+def write_build_stamp(build_stamp: str | None) -> None:
+  if build_stamp is None:
+    return
+  MASK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+  BUILD_STAMP_PATH.write_text(f'{build_stamp}\n', encoding='utf-8')
+
+
+def parse_args() -> argparse.Namespace:
+  parser = argparse.ArgumentParser(description='Build app icon assets from the branding source icon.')
+  parser.add_argument(
+    '--from-system',
+    action='store_true',
+    help='extract the rounded mask from native macOS app icons instead of generating it (macOS only)',
+  )
+  parser.add_argument(
+    '--no-cache',
+    action='store_true',
+    help='with --from-system, re-extract the mask instead of reusing branding/.cache (implies --force)',
+  )
+  parser.add_argument(
+    '--force',
+    action='store_true',
+    help='rebuild even if the outputs are newer than the source icon',
   )
-  rounded_desktop_icon.save(DESKTOP_ICON_ICNS_PATH, format='ICNS')
-  return container_source, rounded_shape_source
+  return parser.parse_args()
 
 
 def main() -> None:
+  args = parse_args()
   if not SOURCE_ICON_PATH.exists():
     raise SystemExit(f'[branding] source icon missing: {SOURCE_ICON_PATH}')
 
+  build_stamp = get_build_stamp(args.from_system)
+  if not (args.force or args.no_cache) and is_build_up_to_date(build_stamp):
+    print('[branding] icon outputs are up to date (pass --force to rebuild)')
+    return
+
   print(f'[branding] using source icon: {SOURCE_ICON_PATH}')
 
-  container_source, rounded_shape_source = build_icons_from_source(SOURCE_ICON_PATH)
+  system_sources = build_icons_from_source(
+    SOURCE_ICON_PATH,
+    from_system=args.from_system,
+    use_cache=not args.no_cache,
+  )
+  write_build_stamp(build_stamp)
   print(f'[branding] updated renderer icon: {RENDERER_ICON_PATH}')
   print(f'[branding] updated desktop source copy png: {DESKTOP_SOURCE_COPY_PATH}')
   print(f'[branding] updated desktop rounded icon png: {DESKTOP_ICON_PNG_PATH}')
   print(f'[branding] updated desktop icon ico: {DESKTOP_ICON_ICO_PATH}')
   print(f'[branding] updated desktop icon icns: {DESKTOP_ICON_ICNS_PATH}')
+  if system_sources is None:
+    print('[branding] rounded mask: generated squircle')
+    return
+
+  container_source, rounded_shape_source = system_sources
   print(f'[branding] macOS container bbox source: {container_source}')
   print(f'[branding] macOS rounded-shape source: {rounded_shape_source}')
 